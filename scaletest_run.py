@@ -0,0 +1,138 @@
+import os
+import sys
+import time
+import timeit
+import shutil
+import sqlite3
+import tempfile
+import importlib
+import tracemalloc
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg') # render to file only, the scale test never opens a window
+import matplotlib.pyplot as plt
+
+# when imported from an IPython console this directory is only on the path as '' (the current directory),
+# which stops pointing here once the scale test changes directory and dataviz_funcs is imported
+if os.path.dirname(os.path.abspath(__file__)) not in sys.path:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import backend
+import scraper_run
+import synthetic_funcs
+
+def load_database():
+    """Loads both tables through backend, the same way dataviz_funcs does."""
+    backend.retrieve_all_results()
+    backend.retrieve_all_boxscores()
+
+def check_for_date():
+    """Runs run_scraper's duplicate check: retrieves every date then looks for the date being scraped."""
+    dates = scraper_run.get_database_dates()
+    found = datetime(2017, 10, 17).date() in dates
+    return found
+
+def count_heatmap_cells(dvf, team_name):
+    """Returns the number of players multiplied by the number of games for a team, which is the number of
+    cells in that team's heatmap."""
+    team_boxscores = dvf.boxscore_data[dvf.boxscore_data['Team'] == team_name]
+    return team_boxscores['Player Name'].nunique() * team_boxscores['GameID'].nunique()
+
+def measure_scale(seasons, teams=3, seed=0, repeats=10):
+    """Takes in a number of seasons, creates a synthetic database of that size in a temporary directory and
+    returns a dictionary of measurements: the time and peak memory taken to load both tables through backend,
+    the time taken by run_scraper's duplicate date check and the average heatmap size and time taken by
+    heatmap_pipeline for the first few teams. The load and duplicate check are timed repeats times and the
+    fastest time is kept, heatmap_pipeline is only run once per team because it is slow."""
+    cwd = os.getcwd()
+    dvf_imported = 'dataviz_funcs' in sys.modules
+    directory = tempfile.mkdtemp()
+    try:
+        # backend and dataviz_funcs use relative paths, so work from inside the temporary directory
+        os.chdir(directory)
+        os.mkdir('images')
+        result_count, boxscore_count = synthetic_funcs.create_database("NBA_data.db", seasons=seasons, seed=seed)
+
+        # time the load without tracing, tracemalloc more than doubles the load time
+        load_time = min(timeit.repeat(load_database, number=1, repeat=repeats))
+
+        # then load again with tracing on to get the peak memory
+        tracemalloc.start()
+        load_database()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        dedupe_time = min(timeit.repeat(check_for_date, number=1, repeat=repeats))
+
+        # dataviz_funcs loads the database when imported, so reload it if it was imported from another database
+        if 'dataviz_funcs' in sys.modules:
+            dvf = importlib.reload(sys.modules['dataviz_funcs'])
+        else:
+            dvf = importlib.import_module('dataviz_funcs')
+        heatmap_cells, render_times = [], []
+        for team_name in dvf.team_names[:teams]:
+            heatmap_cells.append(count_heatmap_cells(dvf, team_name))
+            start = time.perf_counter()
+            dvf.heatmap_pipeline(team_name)
+            render_times.append(time.perf_counter() - start)
+            plt.close('all') # don't let figures from previous teams slow down the next one
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(directory)
+        # point dataviz_funcs back at the real database so later calls don't plot the synthetic data
+        reloaded = False
+        if dvf_imported & os.path.exists('NBA_data.db'):
+            try:
+                importlib.reload(sys.modules['dataviz_funcs'])
+                reloaded = True
+            except (ValueError, KeyError, sqlite3.OperationalError, pd.io.sql.DatabaseError):
+                # dataviz_funcs can't load the database in this directory, don't hide the original error
+                print('Could not reload dataviz_funcs from ' + cwd + ', import it again before plotting.')
+        if not reloaded:
+            # drop the synthetic version so the next import loads the database from scratch
+            sys.modules.pop('dataviz_funcs', None)
+
+    return {'Seasons':seasons, 'Results':result_count, 'Boxscores':boxscore_count, 'Load time':load_time,
+            'Peak memory':peak_memory, 'Dedupe time':dedupe_time, 'Heatmap cells':np.mean(heatmap_cells),
+            'Render time':np.mean(render_times)}
+
+def scaling_exponent(sizes, values):
+    """Fits values = c * sizes^k on a log-log scale and returns k. A k of 1 means the values grow linearly
+    with size, anything above 1 is worse than linear."""
+    return np.polyfit(np.log(sizes), np.log(values), 1)[0]
+
+def check_scaling(measurements, tolerance=0.2):
+    """Takes in the dataframe of measurements from run_scale_test and raises an AssertionError listing every
+    measurement that grows faster than linearly, allowing for some noise. Render time is compared with the
+    number of heatmap cells, which grows faster than the number of boxscore rows because every season adds
+    both games and players. Everything else is compared with the number of boxscore rows."""
+    sizes = {'Load time':'Boxscores', 'Peak memory':'Boxscores', 'Dedupe time':'Boxscores',
+             'Render time':'Heatmap cells'}
+    failures = []
+    for column, size in sizes.items():
+        exponent = scaling_exponent(measurements[size], measurements[column])
+        print(column + ' scales with exponent ' + str(round(exponent, 2)) + ' against ' + size)
+        if exponent > 1 + tolerance:
+            failures.append(column + ' (exponent ' + str(round(exponent, 2)) + ')')
+    if failures:
+        raise AssertionError('Worse than linear scaling: ' + ', '.join(failures))
+
+def run_scale_test(seasons=(1, 2, 4), teams=3, seed=0, tolerance=0.2, repeats=10):
+    """Takes in a list of season counts and measures load time, peak memory, duplicate check time and
+    per-team render time on a synthetic database of each size. Prints and returns a dataframe of the
+    measurements, raising an AssertionError if any of them scale worse than linearly (render time against
+    the number of heatmap cells, everything else against the number of boxscore rows).
+    **Warning: heatmap_pipeline is slow, at 10 seasons or more this will take a long time**"""
+    measurements = []
+    for count in seasons:
+        print('Measuring ' + str(count) + ' season(s) ....')
+        measurements.append(measure_scale(count, teams=teams, seed=seed, repeats=repeats))
+    measurements = pd.DataFrame(measurements)
+    print(measurements.to_string(index=False))
+    check_scaling(measurements, tolerance=tolerance)
+    return measurements
+
+if __name__ == '__main__':
+    run_scale_test()
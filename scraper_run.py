@@ -6,6 +6,18 @@ from selenium import webdriver
 from selenium.webdriver.firefox.options import Options
 
 
+def get_database_dates():
+    """This function retrieves all results from the database and returns an array containing the date of every game,
+    as date objects. If there are no results in the database then an empty list is returned."""
+    results = backend.retrieve_all_results()
+    if not results.empty:
+        dates = results['GameDate']
+        dates = dates.apply(lambda d:datetime.strptime(d.split(' ')[0], '%Y-%m-%d').date())
+        dates = dates.values
+    else:
+        dates = []
+    return dates
+
 def run_scraper(start_date="17/10/2017", end_date=datetime.strftime(datetime.now(), "%d/%m/%Y")):
     """This function takes in a start date and end date, in the format "dd/mm/yyyy", then uses functions in scraper_funcs
     to scrape match result and boxscore data for all games between the 2 dates from the NBA website.
@@ -32,14 +44,8 @@ def run_scraper(start_date="17/10/2017", end_date=datetime.strftime(datetime.now
         else:
             pass
 
-        # get all results from the database to check if the current date is already in there
-        results = backend.retrieve_all_results()
-        if not results.empty:
-            dates = results['GameDate']
-            dates = dates.apply(lambda d:datetime.strptime(d.split(' ')[0], '%Y-%m-%d').date())
-            dates = dates.values
-        else:
-            dates = []
+        # get all dates from the database to check if the current date is already in there
+        dates = get_database_dates()
 
         # compare current date with list of dates in the results df
         # if it's already there then skip to avoid duplicates
@@ -0,0 +1,303 @@
+import random
+import sqlite3
+from datetime import datetime, timedelta
+import pandas as pd
+
+# the 30 teams as they are named on the NBA website (and in the images folder)
+team_names = ['Atlanta Hawks', 'Boston Celtics', 'Brooklyn Nets', 'Charlotte Hornets', 'Chicago Bulls',
+              'Cleveland Cavaliers', 'Dallas Mavericks', 'Denver Nuggets', 'Detroit Pistons',
+              'Golden State Warriors', 'Houston Rockets', 'Indiana Pacers', 'LA Clippers', 'Los Angeles Lakers',
+              'Memphis Grizzlies', 'Miami Heat', 'Milwaukee Bucks', 'Minnesota Timberwolves',
+              'New Orleans Pelicans', 'New York Knicks', 'Oklahoma City Thunder', 'Orlando Magic',
+              'Philadelphia 76ers', 'Phoenix Suns', 'Portland Trail Blazers', 'Sacramento Kings',
+              'San Antonio Spurs', 'Toronto Raptors', 'Utah Jazz', 'Washington Wizards']
+
+# the all-star game is played between two captains' teams rather than two franchises
+allstar_teams = ['Team LeBron', 'Team Stephen']
+
+# games where the scraper couldn't read the team names are stored with a single space and empty scores
+blank_team = ' '
+blank_score = ''
+
+first_names = ['Aaron', 'Andre', 'Anthony', 'Ben', 'Bradley', 'Brandon', 'Chris', 'Cole', 'Dario', 'Darius',
+               'Derrick', 'Devin', 'Donovan', 'Dwight', 'Eric', 'Gary', 'Gordon', 'Ian', 'Isaiah', 'Jabari',
+               'Jamal', 'James', 'Jason', 'Jaylen', 'Jeff', 'Joel', 'Jonas', 'Jordan', 'Josh', 'Justin', 'Kelly',
+               'Kevin', 'Kyle', 'Lonzo', 'Malik', 'Marcus', 'Mike', 'Myles', 'Nikola', 'Otto', 'Paul', 'Ramon',
+               'Rudy', 'Serge', 'Taj', 'Terry', 'Tim', 'Tobias', 'Tyus', 'Victor', 'Wesley', 'Zach']
+
+last_names = ['Adams', 'Aldrich', 'Anderson', 'Beal', 'Brooks', 'Brown', 'Butler', 'Collins', 'Crawford', 'Davis',
+              'Dieng', 'Evans', 'Frazier', 'Gibson', 'Gortat', 'Green', 'Harris', 'Hayes', 'Holmes', 'Irving',
+              'Jackson', 'Johnson', 'Jones', 'Leaf', 'Mahinmi', 'Meeks', 'Mitchell', 'Morris', 'Oubre', 'Parker',
+              'Porter', 'Rose', 'Scott', 'Sessions', 'Smith', 'Teague', 'Thomas', 'Towns', 'Turner', 'Walker',
+              'Warren', 'Washington', 'White', 'Wiggins', 'Williams', 'Young']
+
+suffixes = ['Jr.', 'II', 'III']
+
+# DNP strings as they appear in the FGM column of the boxscores table, with the relative frequency of each
+coach_reason = "DNP - Coach's Decision"
+injury_reasons = ['DNP - Injury/Illness', 'DND - Injury/Illness', 'NWT - Injury/Illness', 'Inactive - Injury/Illness']
+injury_weights = [6, 2, 2, 1]
+other_reasons = ['DND - Rest', 'NWT - Rest', 'NWT - Personal', 'NWT - Suspended', 'NWT - Trade Pending']
+other_weights = [4, 2, 2, 1, 1]
+
+boxscore_columns = ['Player Name', 'Min', 'FGM', 'FGA', 'FG%', '3PM', '3PA', '3P%', 'FTM', 'FTA', 'FT%',
+                    'OREB', 'DREB', 'REB', 'AST', 'TOV', 'STL', 'BLK', 'PF', 'PTS', '+/-', 'Team', 'Starter', 'GameID']
+result_columns = ['GameID', 'GameDate', 'HomeTeam', 'HomeScore', 'AwayTeam', 'AwayScore']
+
+roster_size = 15 # players on each team's books
+dressed_size = 13 # players listed in each boxscore
+rounds = 82 # every team plays once per round, so this is also the number of games per team
+allstar_day = 120 # days after opening night that the all-star break begins
+allstar_break = 7 # length of the all-star break in days
+scrape_failure_rate = 0.004 # fraction of regular season games stored with blank team names
+padded_minutes_rate = 0.006 # fraction of minutes under 10 stored with a leading zero, i.e. '05:45' rather than '5:45'
+allstar_scoring = 1.45 # the all-star game has far more shots, so scores are around 145-150 rather than 105
+
+def create_player_name(rng, taken):
+    """Takes in a random.Random instance and a set of names already in use and returns a new, unique player name.
+    The name is added to the set."""
+    name = rng.choice(first_names) + ' ' + rng.choice(last_names)
+    if name in taken:
+        # try the common suffixes before resorting to a number
+        for suffix in suffixes:
+            if name + ' ' + suffix not in taken:
+                name = name + ' ' + suffix
+                break
+        else:
+            count = 2
+            while name + ' ' + str(count) in taken:
+                count += 1
+            name = name + ' ' + str(count)
+    taken.add(name)
+    return name
+
+def create_rosters(rng, taken):
+    """Returns a dictionary mapping every team name to a list of roster_size unique player names.
+    Players earlier in the list get more minutes."""
+    rosters = {}
+    for team_name in team_names:
+        rosters[team_name] = [create_player_name(rng, taken) for _ in range(roster_size)]
+    return rosters
+
+def update_rosters(rng, rosters, taken):
+    """Simulates an offseason: every team loses a few players, who are replaced by new players.
+    The new players are inserted at a random point in the rotation."""
+    for team_name in team_names:
+        roster = rosters[team_name]
+        for _ in range(rng.randint(2, 5)):
+            roster.pop(rng.randrange(len(roster)))
+        while len(roster) < roster_size:
+            roster.insert(rng.randrange(len(roster) + 1), create_player_name(rng, taken))
+
+def create_schedule(rng, season):
+    """Takes in the year a season starts and returns a list of [GameID, GameDate, HomeTeam, AwayTeam] for every
+    regular season game. Every team plays once per round and each round is spread over two days."""
+    opening_night = datetime(season, 10, 17)
+    yy = str(season % 100).zfill(2)
+    schedule = []
+    for round_number in range(rounds):
+        teams = team_names[:]
+        rng.shuffle(teams)
+        for index in range(0, len(teams), 2):
+            day = 2*round_number + (index >= len(teams)/2) # first half of the round on day one, the rest on day two
+            if day >= allstar_day:
+                day += allstar_break # no regular season games during the all-star break
+            gamedate = opening_night + timedelta(days=day)
+            schedule.append([gamedate, teams[index], teams[index + 1]])
+    schedule.sort(key=lambda game: game[0]) # gameids are assigned in date order
+    return [['002' + yy + str(number + 1).zfill(5)] + game for number, game in enumerate(schedule)]
+
+def format_percentage(made, attempted):
+    """Formats a shooting percentage the way it appears on the NBA website, i.e. '45.5', '100' or '0.0'."""
+    if attempted == 0:
+        return '0.0'
+    elif made == attempted:
+        return '100'
+    return '{:.1f}'.format(100*made/attempted)
+
+def count_makes(rng, attempts, probability):
+    """Returns the number of successful attempts out of the given number of attempts."""
+    return sum(rng.random() < probability for _ in range(attempts))
+
+def split_minutes(rng, players):
+    """Takes in the number of players that got on the court and returns a list of their playing time in seconds.
+    The first 5 players are starters and get more minutes, the total always adds up to 240 minutes."""
+    weights = [rng.uniform(28, 38) if index < 5 else rng.uniform(2, 24) for index in range(players)]
+    seconds = [int(48*5*60*weight/sum(weights)) for weight in weights]
+    seconds[0] += 48*5*60 - sum(seconds) # give any rounding error to the first starter
+    return seconds
+
+def create_player_row(rng, name, seconds, scoring=1):
+    """Takes in a player name and the number of seconds they played and returns a list of their box score stats,
+    from 'Player Name' to 'PTS'. scoring multiplies the number of shots the player takes."""
+    minutes = seconds/60
+    fga = int(round(scoring*minutes*rng.uniform(0.15, 0.55)))
+    tpa = int(round(fga*rng.uniform(0, 0.5)))
+    tpm = count_makes(rng, tpa, 0.36)
+    fgm = tpm + count_makes(rng, fga - tpa, 0.5)
+    fta = int(round(minutes*rng.uniform(0, 0.2)))
+    ftm = count_makes(rng, fta, 0.77)
+    oreb = int(round(minutes*rng.uniform(0, 0.08)))
+    dreb = int(round(minutes*rng.uniform(0, 0.25)))
+    pts = 2*fgm + tpm + ftm
+    # the website usually writes minutes under 10 as '5:45', but occasionally as '05:45'
+    whole_minutes = str(seconds // 60)
+    if rng.random() < padded_minutes_rate:
+        whole_minutes = whole_minutes.zfill(2)
+    row = [name, whole_minutes + ':' + str(seconds % 60).zfill(2),
+           fgm, fga, format_percentage(fgm, fga), tpm, tpa, format_percentage(tpm, tpa),
+           ftm, fta, format_percentage(ftm, fta), oreb, dreb, oreb + dreb,
+           int(round(minutes*rng.uniform(0, 0.2))), int(round(minutes*rng.uniform(0, 0.08))),
+           int(round(minutes*rng.uniform(0, 0.05))), int(round(minutes*rng.uniform(0, 0.05))),
+           rng.randint(0, min(6, int(minutes/6) + 1)), pts]
+    return [str(stat) for stat in row]
+
+def create_dnp_row(name, reason):
+    """Returns a box score row for a player that didn't play. The reason is stored in the FGM column,
+    padded with spaces as it is on the NBA website, the minutes are blank and every other stat is NULL."""
+    return [name, '', reason.ljust(40)] + [None]*17
+
+def create_blank_row(name):
+    """Returns a box score row for a player listed with no stats at all, which the website occasionally shows."""
+    return [name, '', '', '', '-', '', '', '-', '', '', '-'] + ['']*9
+
+def create_team_boxscore(rng, roster, injuries, scoring=1):
+    """Takes in a roster and a dictionary of games each player will miss through injury, and returns the rows
+    of the box score for one team, from 'Player Name' to 'PTS', along with the starter flags and the team's score.
+    Two players are left off the boxscore entirely, healthy players at the end of the bench may not play.
+    scoring is passed on to create_player_row."""
+    dressed = roster[:]
+    for _ in range(len(roster) - dressed_size):
+        # players at the end of the rotation are the most likely to be left out
+        dressed.pop(min(rng.randrange(len(dressed)), rng.randrange(len(dressed))))
+
+    playing, benched = [], []
+    for index, name in enumerate(dressed):
+        if injuries.get(name, 0) > 0:
+            benched.append((name, rng.choices(injury_reasons, injury_weights)[0]))
+        elif rng.random() < 0.01:
+            benched.append((name, rng.choices(other_reasons, other_weights)[0]))
+        elif (index >= 10) & (rng.random() < 0.6):
+            benched.append((name, coach_reason))
+        else:
+            playing.append(name)
+
+    rows = []
+    for name, seconds in zip(playing, split_minutes(rng, len(playing))):
+        if rng.random() < 0.0005:
+            rows.append(create_blank_row(name))
+        else:
+            rows.append(create_player_row(rng, name, seconds, scoring))
+    rows += [create_dnp_row(name, reason) for name, reason in benched]
+    starters = [1 if index < 5 else 0 for index in range(len(rows))]
+    score = sum(int(row[19]) for row in rows if row[19] not in ['', None])
+    return rows, starters, score
+
+def update_injuries(rng, roster, injuries):
+    """Counts down the games remaining for injured players on a roster and occasionally injures a healthy player."""
+    for name in roster:
+        if injuries.get(name, 0) > 0:
+            injuries[name] -= 1
+        elif rng.random() < 0.01:
+            injuries[name] = rng.randint(1, 12)
+
+def create_game(rng, gameid, gamedate, home_team, away_team, home_roster, away_roster, injuries,
+                home_name=None, away_name=None, scoring=1):
+    """Simulates a single game between two rosters and returns a result dataframe and a boxscore dataframe in the
+    same format as scraper_funcs.get_boxscore. home_name and away_name override the team name that is stored,
+    which is how the all-star game and games with blank team names are created. scoring is passed on to
+    create_player_row."""
+    home_name = home_team if home_name is None else home_name
+    away_name = away_team if away_name is None else away_name
+
+    home_rows, home_starters, home_score = create_team_boxscore(rng, home_roster, injuries, scoring)
+    away_rows, away_starters, away_score = create_team_boxscore(rng, away_roster, injuries, scoring)
+    while home_score == away_score:
+        # there are no ties in the NBA, so play the away team's game again
+        away_rows, away_starters, away_score = create_team_boxscore(rng, away_roster, injuries, scoring)
+
+    # each player's +/- is centred on their share of the final margin
+    for rows, margin in [(home_rows, home_score - away_score), (away_rows, away_score - home_score)]:
+        for row in rows:
+            if row[1] == '':
+                # blank rows have a '-' in the percentage and +/- columns, DNP rows are NULL
+                row.append('-' if row[4] == '-' else None)
+            else:
+                minutes = int(row[1].split(':')[0])
+                row.append(str(int(round(margin*minutes/48 + rng.gauss(0, 6)))))
+
+    if home_name == blank_team:
+        # the scraper stores blank scores alongside blank team names
+        home_score, away_score = blank_score, blank_score
+
+    result = pd.DataFrame([[gameid, gamedate, home_name, str(home_score), away_name, str(away_score)]],
+                          columns=result_columns)
+    boxscore = pd.DataFrame([row + [home_name, starter, gameid] for row, starter in zip(home_rows, home_starters)] +
+                            [row + [away_name, starter, gameid] for row, starter in zip(away_rows, away_starters)],
+                            columns=boxscore_columns)
+    return result, boxscore
+
+def create_season(rng, season, rosters):
+    """Takes in the year a season starts and the current rosters and returns a results dataframe and a boxscores
+    dataframe containing every game of that season, including the all-star weekend oddities."""
+    yy = str(season % 100).zfill(2)
+    injuries = {}
+    results, boxscores = [], []
+
+    for gameid, gamedate, home_team, away_team in create_schedule(rng, season):
+        if rng.random() < scrape_failure_rate:
+            home_name, away_name = blank_team, blank_team
+        else:
+            home_name, away_name = home_team, away_team
+        result, boxscore = create_game(rng, gameid, gamedate, home_team, away_team, rosters[home_team],
+                                       rosters[away_team], injuries, home_name, away_name)
+        results.append(result)
+        boxscores.append(boxscore)
+        update_injuries(rng, rosters[home_team], injuries)
+        update_injuries(rng, rosters[away_team], injuries)
+
+    # all-star weekend, the rising stars game is stored with blank team names
+    # and the all-star game is played between the two captains' teams
+    opening_night = datetime(season, 10, 17)
+    stars = [rosters[team_name][0] for team_name in team_names]
+    rookies = [rosters[team_name][-1] for team_name in team_names]
+    rng.shuffle(stars)
+    rng.shuffle(rookies)
+    allstar_games = [['003' + yy + '00001', opening_night + timedelta(days=allstar_day + 5), stars[:12], stars[12:24],
+                      allstar_teams[0], allstar_teams[1], allstar_scoring],
+                     ['003' + yy + '00002', opening_night + timedelta(days=allstar_day + 3), rookies[:12],
+                      rookies[12:24], blank_team, blank_team, allstar_scoring]]
+    for gameid, gamedate, home_roster, away_roster, home_name, away_name, scoring in allstar_games:
+        result, boxscore = create_game(rng, gameid, gamedate, home_name, away_name, home_roster, away_roster, {},
+                                       scoring=scoring)
+        results.append(result)
+        boxscores.append(boxscore)
+
+    results = pd.concat(results, ignore_index=True).sort_values(by='GameDate', kind='mergesort')
+    boxscores = pd.concat(boxscores, ignore_index=True)
+    return results, boxscores
+
+def create_database(db_name="synthetic_NBA_data.db", seasons=1, first_season=2017, seed=0):
+    """Creates an SQLite database with results and boxscores tables in the same format as NBA_data.db,
+    filled with synthetic data for the given number of seasons, starting with the season beginning in
+    first_season. The same seed always produces the same database. Any existing results and boxscores
+    tables in the database are replaced. Returns the number of rows in the results and boxscores tables."""
+    rng = random.Random(seed)
+    taken = set()
+    rosters = create_rosters(rng, taken)
+    result_count, boxscore_count = 0, 0
+
+    connection = sqlite3.connect(db_name)
+    for season in range(first_season, first_season + seasons):
+        if season > first_season:
+            update_rosters(rng, rosters, taken)
+        results, boxscores = create_season(rng, season, rosters)
+        # the first season replaces any existing tables, every season after is appended
+        if_exists = "replace" if season == first_season else "append"
+        results.to_sql("results", connection, if_exists=if_exists, index=False)
+        boxscores.to_sql("boxscores", connection, if_exists=if_exists, index=False)
+        connection.commit()
+        result_count += len(results)
+        boxscore_count += len(boxscores)
+    connection.close()
+    return result_count, boxscore_count